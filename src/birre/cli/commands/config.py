@@ -319,6 +319,26 @@ def _collect_config_file_entries(
     return result
 
 
+# Environment variables reported by ``config show``, in display order
+_ENV_OVERRIDE_NAMES: Final[tuple[str, ...]] = (
+    "BIRRE_CONFIG",
+    "BITSIGHT_API_KEY",
+    "BIRRE_SUBSCRIPTION_FOLDER",
+    "BIRRE_SUBSCRIPTION_TYPE",
+    "BIRRE_CONTEXT",
+    "BIRRE_RISK_VECTOR_FILTER",
+    "BIRRE_MAX_FINDINGS",
+    "BIRRE_SKIP_STARTUP_CHECKS",
+    "BIRRE_DEBUG",
+    "BIRRE_ALLOW_INSECURE_TLS",
+    "BIRRE_CA_BUNDLE",
+    "BIRRE_LOG_LEVEL",
+    "BIRRE_LOG_FORMAT",
+    "BIRRE_LOG_FILE",
+    "BIRRE_LOG_MAX_BYTES",
+    "BIRRE_LOG_BACKUP_COUNT",
+)
+
 # Mapping of (invocation_path, settings_key) for extracting CLI overrides
 _CLI_OVERRIDE_MAPPINGS: Final[list[tuple[tuple[str, ...], str]]] = [
     (("auth", "api_key"), BITSIGHT_API_KEY_KEY),
@@ -359,28 +379,6 @@ def _collect_cli_override_values(invocation: CliInvocation) -> dict[str, Any]:
     return details
 
 
-def _build_cli_source_labels(invocation: CliInvocation) -> dict[str, str]:
-    """Build source labels for CLI overrides."""
-    labels: dict[str, str] = {}
-    for path, settings_key in _CLI_OVERRIDE_MAPPINGS:
-        value = _get_invocation_value(invocation, path)
-        if value is not None:
-            labels[settings_key] = "CLI"
-    return labels
-
-
-def _build_env_source_labels(env_overrides: Mapping[str, str]) -> dict[str, str]:
-    """Build source labels for environment variable overrides."""
-    from birre.config.settings import ENVVAR_TO_SETTINGS_KEY
-
-    labels: dict[str, str] = {}
-    for env_var in env_overrides:
-        config_key = ENVVAR_TO_SETTINGS_KEY.get(env_var)
-        if config_key:
-            labels[config_key] = f"ENV ({env_var})"
-    return labels
-
-
 def _build_cli_override_rows(
     invocation: CliInvocation,
 ) -> Sequence[tuple[str, str, str]]:
@@ -634,46 +632,24 @@ def _cmd_config_show(  # NOSONAR python:S107
         files_table.add_row(str(file), status)
     stdout_console.print(files_table)
 
-    env_overrides = {
-        name: os.getenv(name)
-        for name in (
-            "BIRRE_CONFIG",
-            "BITSIGHT_API_KEY",
-            "BIRRE_SUBSCRIPTION_FOLDER",
-            "BIRRE_SUBSCRIPTION_TYPE",
-            "BIRRE_CONTEXT",
-            "BIRRE_RISK_VECTOR_FILTER",
-            "BIRRE_MAX_FINDINGS",
-            "BIRRE_SKIP_STARTUP_CHECKS",
-            "BIRRE_DEBUG",
-            "BIRRE_ALLOW_INSECURE_TLS",
-            "BIRRE_CA_BUNDLE",
-            "BIRRE_LOG_LEVEL",
-            "BIRRE_LOG_FORMAT",
-            "BIRRE_LOG_FILE",
-            "BIRRE_LOG_MAX_BYTES",
-            "BIRRE_LOG_BACKUP_COUNT",
-        )
-        if os.getenv(name) is not None
-    }
-    # Filter out None values for type compatibility
-    env_overrides_filtered: dict[str, str] = {
-        k: v for k, v in env_overrides.items() if v is not None
+    environ = os.environ
+    env_overrides: dict[str, str] = {
+        name: value
+        for name in _ENV_OVERRIDE_NAMES
+        if (value := environ.get(name)) is not None
     }
-    env_labels = _build_env_source_labels(env_overrides_filtered)
-    env_rows = list(_build_env_override_rows(env_overrides_filtered))
+    env_rows = list(_build_env_override_rows(env_overrides))
+    env_labels = {key: label for key, _, label in env_rows}
     if env_rows:
         stdout_console.print()
         _print_config_table("Environment overrides", env_rows, stdout_console)
 
-    cli_labels = {
-        key: label
-        for key, label in _build_cli_source_labels(invocation).items()
-        if key not in env_labels
-    }
+    # Each override is read from the invocation once; the source labels come
+    # from the same rows that are printed.
     cli_rows = [
         row for row in _build_cli_override_rows(invocation) if row[0] not in env_labels
     ]
+    cli_labels = {key: label for key, _, label in cli_rows}
     if cli_rows:
         stdout_console.print()
         _print_config_table("CLI overrides", cli_rows, stdout_console)
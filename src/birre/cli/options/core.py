@@ -13,16 +13,15 @@ from typing import Annotated, Final
 import typer
 
 LOG_FORMAT_CHOICES: Final[set[str]] = {"text", "json"}
-LOG_LEVEL_CHOICES: Final[list[str]] = sorted(
-    name
+_LEVEL_NAMES_MAPPING: Final[dict[str, int]] = {
+    name: value
     for name, value in logging.getLevelNamesMapping().items()
     if isinstance(name, str) and not name.isdigit()
-)
+}
+LOG_LEVEL_CHOICES: Final[list[str]] = sorted(_LEVEL_NAMES_MAPPING)
 LOG_LEVEL_SET: Final[set[str]] = {choice.upper() for choice in LOG_LEVEL_CHOICES}
 LOG_LEVEL_MAP: Final[dict[str, int]] = {
-    name.upper(): value
-    for name, value in logging.getLevelNamesMapping().items()
-    if isinstance(name, str) and not name.isdigit()
+    name.upper(): value for name, value in _LEVEL_NAMES_MAPPING.items()
 }
 
 ConfigPathOption = Annotated[
@@ -4,30 +4,29 @@ from __future__ import annotations
 
 import logging
 import os
-from collections.abc import Iterator, Mapping, Sequence
-from dataclasses import dataclass, field
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from pathlib import Path
 from types import MappingProxyType
 from typing import Any
 
-from dynaconf import Dynaconf
+from dynaconf import Dynaconf, default_settings
 
 from .constants import CONFIG_ENVVAR, DEFAULT_CONFIG_FILENAME, LOCAL_CONFIG_FILENAME
 
 _REPO_ROOT = Path(__file__).resolve().parent.parent
 
-DEFAULT_RISK_VECTOR_FILTER = ",".join(
-    [
-        "botnet_infections",
-        "spam_propagation",
-        "malware_servers",
-        "unsolicited_comm",
-        "potentially_exploited",
-        "open_ports",
-        "patching_cadence",
-        "insecure_systems",
-        "server_software",
-    ]
+DEFAULT_RISK_VECTOR_FILTER = (
+    "botnet_infections,"
+    "spam_propagation,"
+    "malware_servers,"
+    "unsolicited_comm,"
+    "potentially_exploited,"
+    "open_ports,"
+    "patching_cadence,"
+    "insecure_systems,"
+    "server_software"
 )
 DEFAULT_MAX_FINDINGS = 10
 
@@ -38,9 +37,22 @@ DEFAULT_LOG_LEVEL = "INFO"
 DEFAULT_MAX_BYTES = 10_000_000
 DEFAULT_BACKUP_COUNT = 5
 
-_ALLOWED_CONTEXTS = {"standard", "risk_manager"}
-_TRUTHY = {"1", "true", "yes", "on"}
-_FALSY = {"0", "false", "no", "off"}
+# Snapshot of the standard level names; like the CLI's LOG_LEVEL_MAP, levels
+# registered later with logging.addLevelName are not picked up.
+_LEVEL_NAMES_MAPPING = logging.getLevelNamesMapping()
+_DEFAULT_LEVEL = _LEVEL_NAMES_MAPPING.get(DEFAULT_LOG_LEVEL, logging.INFO)
+
+_ALLOWED_CONTEXTS = frozenset({"standard", "risk_manager"})
+_ALLOWED_LOG_FORMATS = frozenset({LOG_FORMAT_TEXT, LOG_FORMAT_JSON})
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+_FALSY = frozenset({"0", "false", "no", "off"})
+# Exact spellings seen in env files and TOML, resolved without normalising.
+_BOOL_STRINGS = {
+    spelling: flag
+    for words, flag in ((_TRUTHY, True), (_FALSY, False))
+    for word in words
+    for spelling in (word, word.upper(), word.title())
+}
 
 LOGFILE_DISABLE_SENTINELS = {
     "-",
@@ -104,6 +116,9 @@ _ENVIRONMENT_MAP = {
 
 ENVVAR_TO_SETTINGS_KEY: Mapping[str, str] = MappingProxyType(_ENVIRONMENT_MAP)
 
+# ``DEBUG`` is honoured as a fallback for ``runtime.debug``.
+_ENVIRONMENT_SNAPSHOT_KEYS = (*_ENVIRONMENT_MAP, "DEBUG")
+
 
 def _normalize_config_path(value: Any | None) -> Path | None:
     if value is None:
@@ -118,13 +133,13 @@ def _normalize_config_path(value: Any | None) -> Path | None:
     return candidate
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SubscriptionInputs:
     folder: str | None = None
     type: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RuntimeInputs:
     context: str | None = None
     debug: bool | None = None
@@ -133,13 +148,13 @@ class RuntimeInputs:
     skip_startup_checks: bool | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TlsInputs:
     allow_insecure: bool | None = None
     ca_bundle_path: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LoggingInputs:
     level: str | None = None
     format: str | None = None
@@ -157,7 +172,7 @@ class LoggingInputs:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RuntimeSettings(Mapping[str, Any]):
     api_key: str
     subscription_folder: str | None
@@ -189,7 +204,7 @@ class RuntimeSettings(Mapping[str, Any]):
         return {field: getattr(self, field) for field in self.__dataclass_fields__}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LoggingSettings:
     level: int
     format: str
@@ -203,6 +218,14 @@ class LoggingSettings:
         return logging.getLevelName(level)
 
 
+@lru_cache(maxsize=32)
+def _local_path_for(config_path: str) -> str:
+    """Return the ``.local`` overlay path that sits next to ``config_path``."""
+
+    config_file = Path(config_path)
+    return str(config_file.with_name(f"{config_file.stem}.local{config_file.suffix}"))
+
+
 def _default_settings_files(
     config_path: str | None,
 ) -> tuple[Sequence[str], str | None]:
@@ -213,16 +236,14 @@ def _default_settings_files(
             selected_path = env_override
 
     if selected_path is not None:
-        config_file = selected_path
-        local_file = config_file.with_name(
-            f"{config_file.stem}.local{config_file.suffix}"
-        )
+        config_file = str(selected_path)
+        local_file = _local_path_for(config_file)
         files: list[str] = []
-        if config_file.exists():
-            files.append(str(config_file))
-        if local_file.exists():
-            files.append(str(local_file))
-        return files or [str(config_file)], None
+        if selected_path.exists():
+            files.append(config_file)
+        if Path(local_file).exists():
+            files.append(local_file)
+        return files or [config_file], None
     return [DEFAULT_CONFIG_FILENAME, LOCAL_CONFIG_FILENAME], str(_REPO_ROOT)
 
 
@@ -250,9 +271,12 @@ def _coerce_str(value: Any | None) -> str | None:
 def _coerce_bool(value: Any | None) -> bool | None:
     if value is None:
         return None
-    if isinstance(value, bool):
+    if type(value) is bool:
         return value
     if isinstance(value, str):
+        exact = _BOOL_STRINGS.get(value)
+        if exact is not None:
+            return exact
         normalized = value.strip().lower()
         if not normalized:
             return None
@@ -266,106 +290,89 @@ def _coerce_bool(value: Any | None) -> bool | None:
     return None
 
 
-def _coerce_int(value: Any | None) -> int | None:
+def _coerce_positive_int(value: Any | None) -> int | None:
+    """Return ``value`` as a positive int, or ``None`` when it is not one."""
+
+    if type(value) is int:
+        return value if value > 0 else None
     if value is None:
         return None
     try:
         coerced = int(value)
     except (TypeError, ValueError):
         return None
-    return coerced
-
+    return coerced if coerced > 0 else None
 
-def _apply_environment_overrides(settings: Dynaconf) -> None:
-    for env_var, key in _ENVIRONMENT_MAP.items():
-        raw = os.getenv(env_var)
-        if raw is None:
-            continue
-        if isinstance(raw, str) and not raw.strip():
-            continue
-        settings.set(key, raw)
-    debug_fallback = os.getenv("DEBUG")
-    if debug_fallback and debug_fallback.strip():
-        settings.set(RUNTIME_DEBUG_KEY, debug_fallback)
 
+def _environment_snapshot() -> dict[str, str]:
+    """Return the non-blank BiRRe variables from ``os.environ`` in one pass."""
 
-def _apply_api_key(settings: Dynaconf, api_key_input: str | None) -> None:
-    if api_key_input:
-        settings.set(BITSIGHT_API_KEY_KEY, api_key_input)
+    environ = os.environ
+    return {
+        name: value
+        for name in _ENVIRONMENT_SNAPSHOT_KEYS
+        if (value := environ.get(name)) and not value.isspace()
+    }
 
 
-def _apply_subscription_inputs(
-    settings: Dynaconf, subscription_inputs: SubscriptionInputs | None
+def _apply_environment_overrides(
+    settings: Dynaconf, env: Mapping[str, str] | None = None
 ) -> None:
-    if subscription_inputs is None:
-        return
-
-    if subscription_inputs.folder is not None:
-        settings.set(
-            BITSIGHT_SUBSCRIPTION_FOLDER_KEY, subscription_inputs.folder.strip()
-        )
-    if subscription_inputs.type is not None:
-        settings.set(BITSIGHT_SUBSCRIPTION_TYPE_KEY, subscription_inputs.type.strip())
-
+    if env is None:
+        env = _environment_snapshot()
+    for env_var, key in _ENVIRONMENT_MAP.items():
+        raw = env.get(env_var)
+        if raw is not None:
+            settings.set(key, raw)
+    debug_fallback = env.get("DEBUG")
+    if debug_fallback is not None:
+        settings.set(RUNTIME_DEBUG_KEY, debug_fallback)
 
-def _apply_runtime_inputs(
-    settings: Dynaconf, runtime_inputs: RuntimeInputs | None
-) -> None:
-    if runtime_inputs is None:
-        return
 
-    if runtime_inputs.context is not None:
-        settings.set(ROLE_CONTEXT_KEY, runtime_inputs.context.strip())
-    if runtime_inputs.debug is not None:
-        settings.set(RUNTIME_DEBUG_KEY, runtime_inputs.debug)
-    if runtime_inputs.risk_vector_filter is not None:
-        settings.set(
-            ROLE_RISK_VECTOR_FILTER_KEY, runtime_inputs.risk_vector_filter.strip()
-        )
-    if runtime_inputs.max_findings is not None:
-        settings.set(ROLE_MAX_FINDINGS_KEY, runtime_inputs.max_findings)
-    if runtime_inputs.skip_startup_checks is not None:
-        settings.set(
-            RUNTIME_SKIP_STARTUP_CHECKS_KEY, runtime_inputs.skip_startup_checks
-        )
+# (attribute, settings key, is_text) per CLI input group; text values are
+# stripped before they are stored.
+_InputSpec = tuple[tuple[str, str, bool], ...]
 
+_SUBSCRIPTION_INPUT_SPEC: _InputSpec = (
+    ("folder", BITSIGHT_SUBSCRIPTION_FOLDER_KEY, True),
+    ("type", BITSIGHT_SUBSCRIPTION_TYPE_KEY, True),
+)
+_RUNTIME_INPUT_SPEC: _InputSpec = (
+    ("context", ROLE_CONTEXT_KEY, True),
+    ("debug", RUNTIME_DEBUG_KEY, False),
+    ("risk_vector_filter", ROLE_RISK_VECTOR_FILTER_KEY, True),
+    ("max_findings", ROLE_MAX_FINDINGS_KEY, False),
+    ("skip_startup_checks", RUNTIME_SKIP_STARTUP_CHECKS_KEY, False),
+)
+_TLS_INPUT_SPEC: _InputSpec = (
+    ("allow_insecure", RUNTIME_ALLOW_INSECURE_TLS_KEY, False),
+    ("ca_bundle_path", RUNTIME_CA_BUNDLE_PATH_KEY, True),
+)
+_LOGGING_INPUT_SPEC: _InputSpec = (
+    ("level", LOGGING_LEVEL_KEY, True),
+    ("format", LOGGING_FORMAT_KEY, True),
+    ("file_path", LOGGING_FILE_KEY, True),
+    ("max_bytes", LOGGING_MAX_BYTES_KEY, False),
+    ("backup_count", LOGGING_BACKUP_COUNT_KEY, False),
+)
 
-def _apply_tls_inputs(settings: Dynaconf, tls_inputs: TlsInputs | None) -> None:
-    if tls_inputs is None:
-        return
 
-    if tls_inputs.allow_insecure is not None:
-        settings.set(RUNTIME_ALLOW_INSECURE_TLS_KEY, tls_inputs.allow_insecure)
-    if tls_inputs.ca_bundle_path is not None:
-        settings.set(RUNTIME_CA_BUNDLE_PATH_KEY, tls_inputs.ca_bundle_path.strip())
+# Settings keys read by runtime_from_settings and logging_from_settings.
+_RUNTIME_SETTINGS_KEYS = frozenset(
+    key
+    for _, key, _ in _SUBSCRIPTION_INPUT_SPEC + _RUNTIME_INPUT_SPEC + _TLS_INPUT_SPEC
+) | {BITSIGHT_API_KEY_KEY}
+_LOGGING_SETTINGS_KEYS = frozenset(key for _, key, _ in _LOGGING_INPUT_SPEC)
 
 
-def _apply_logging_inputs(
-    settings: Dynaconf, logging_inputs: LoggingInputs | None
-) -> None:
-    if logging_inputs is None:
+def _apply_inputs(settings: Dynaconf, inputs: Any | None, spec: _InputSpec) -> None:
+    if inputs is None:
         return
 
-    kwargs = logging_inputs.as_kwargs()
-    level_override = kwargs["level_override"]
-    if level_override is not None:
-        settings.set(LOGGING_LEVEL_KEY, level_override.strip())
-
-    format_override = kwargs["format_override"]
-    if format_override is not None:
-        settings.set(LOGGING_FORMAT_KEY, format_override.strip())
-
-    file_override = kwargs["file_override"]
-    if file_override is not None:
-        settings.set(LOGGING_FILE_KEY, file_override.strip())
-
-    max_bytes_override = kwargs["max_bytes_override"]
-    if max_bytes_override is not None:
-        settings.set(LOGGING_MAX_BYTES_KEY, max_bytes_override)
-
-    backup_count_override = kwargs["backup_count_override"]
-    if backup_count_override is not None:
-        settings.set(LOGGING_BACKUP_COUNT_KEY, backup_count_override)
+    for attribute, key, is_text in spec:
+        value = getattr(inputs, attribute)
+        if value is not None:
+            settings.set(key, value.strip() if is_text else value)
 
 
 def _apply_cli_overrides(
@@ -377,24 +384,82 @@ def _apply_cli_overrides(
     tls_inputs: TlsInputs | None,
     logging_inputs: LoggingInputs | None,
 ) -> None:
-    _apply_api_key(settings, api_key_input)
-    _apply_subscription_inputs(settings, subscription_inputs)
-    _apply_runtime_inputs(settings, runtime_inputs)
-    _apply_tls_inputs(settings, tls_inputs)
-    _apply_logging_inputs(settings, logging_inputs)
+    if api_key_input:
+        settings.set(BITSIGHT_API_KEY_KEY, api_key_input)
+    _apply_inputs(settings, subscription_inputs, _SUBSCRIPTION_INPUT_SPEC)
+    _apply_inputs(settings, runtime_inputs, _RUNTIME_INPUT_SPEC)
+    _apply_inputs(settings, tls_inputs, _TLS_INPUT_SPEC)
+    _apply_inputs(settings, logging_inputs, _LOGGING_INPUT_SPEC)
 
 
-def _build_dynaconf(config_path: str | None) -> Dynaconf:
+_DOTENV_LOADED_ROOTS: set[tuple[str | None, str]] = set()
+
+
+def _load_dotenv_once(root_path: str | None) -> None:
+    """Load ``.env`` into the process environment once per search root.
+
+    Dynaconf repeats its ``.env`` search (a walk up from the project root, the
+    script directory and the working directory) every time an instance is set
+    up. The values never override existing variables, so a repeat search only
+    finds what is already in ``os.environ``. The search also walks the working
+    directory whether or not a project root is given, so it is keyed on both.
+    """
+    key = (root_path, os.getcwd())
+    if key in _DOTENV_LOADED_ROOTS:
+        return
+    default_settings.start_dotenv(root_path=root_path)
+    _DOTENV_LOADED_ROOTS.add(key)
+
+
+def reset_dotenv_cache() -> None:
+    """Forget which ``.env`` roots were loaded so the next build searches again."""
+
+    _DOTENV_LOADED_ROOTS.clear()
+
+
+def _overridden_keys(
+    api_key_input: str | None,
+    groups: Iterable[tuple[Any | None, _InputSpec]],
+) -> frozenset[str]:
+    """Return the settings keys that the CLI inputs will set."""
+
+    keys = {BITSIGHT_API_KEY_KEY} if api_key_input else set()
+    for inputs, spec in groups:
+        if inputs is not None:
+            keys.update(
+                key
+                for attribute, key, _ in spec
+                if getattr(inputs, attribute) is not None
+            )
+    return frozenset(keys)
+
+
+def _build_dynaconf(
+    config_path: str | None,
+    *,
+    required_keys: frozenset[str] = frozenset(),
+    overridden_keys: frozenset[str] = frozenset(),
+) -> Dynaconf:
     files, root_path = _default_settings_files(config_path)
+    _load_dotenv_once(root_path)
+    env = _environment_snapshot()
+    if required_keys:
+        # The snapshot holds mapped variables plus the DEBUG fallback.
+        covered = overridden_keys.union(
+            _ENVIRONMENT_MAP.get(name, RUNTIME_DEBUG_KEY) for name in env
+        )
+        if required_keys <= covered:
+            # Every key the caller reads is overridden, so the files are moot.
+            files = []
     settings = Dynaconf(
         settings_files=list(files),
         envvar_prefix="BIRRE",
         environments=False,
-        load_dotenv=True,
+        load_dotenv=False,
         merge_enabled=True,
         root_path=root_path,
     )
-    _apply_environment_overrides(settings)
+    _apply_environment_overrides(settings, env)
     return settings
 
 
@@ -427,6 +492,8 @@ def apply_cli_overrides(
 
 def _resolve_context(settings: Dynaconf, warnings: list[str]) -> str:
     raw_context = _coerce_str(settings.get(ROLE_CONTEXT_KEY)) or "standard"
+    if raw_context in _ALLOWED_CONTEXTS:
+        return raw_context
     normalized = raw_context.lower()
     if normalized not in _ALLOWED_CONTEXTS:
         warnings.append(
@@ -448,9 +515,8 @@ def _resolve_risk_vector_filter(settings: Dynaconf, warnings: list[str]) -> str:
 
 
 def _resolve_max_findings(settings: Dynaconf, warnings: list[str]) -> int:
-    candidate = settings.get(ROLE_MAX_FINDINGS_KEY)
-    value = _coerce_int(candidate)
-    if value is None or value <= 0:
+    value = _coerce_positive_int(settings.get(ROLE_MAX_FINDINGS_KEY))
+    if value is None:
         warnings.append("Invalid max_findings override; using default configuration")
         return DEFAULT_MAX_FINDINGS
     return value
@@ -464,10 +530,6 @@ def _resolve_bool(settings: Dynaconf, key: str, *, default: bool = False) -> boo
     return coerced
 
 
-def _resolve_subscription_value(settings: Dynaconf, key: str) -> str | None:
-    return _coerce_str(settings.get(key))
-
-
 def runtime_from_settings(settings: Dynaconf) -> RuntimeSettings:
     """Extract runtime settings and validation messages from Dynaconf."""
 
@@ -477,12 +539,8 @@ def runtime_from_settings(settings: Dynaconf) -> RuntimeSettings:
     if not api_key:
         raise ValueError("BITSIGHT_API_KEY is required (config/env/CLI)")
 
-    subscription_folder = _resolve_subscription_value(
-        settings, BITSIGHT_SUBSCRIPTION_FOLDER_KEY
-    )
-    subscription_type = _resolve_subscription_value(
-        settings, BITSIGHT_SUBSCRIPTION_TYPE_KEY
-    )
+    subscription_folder = _coerce_str(settings.get(BITSIGHT_SUBSCRIPTION_FOLDER_KEY))
+    subscription_type = _coerce_str(settings.get(BITSIGHT_SUBSCRIPTION_TYPE_KEY))
 
     context = _resolve_context(settings, warnings)
     risk_vector_filter = _resolve_risk_vector_filter(settings, warnings)
@@ -524,31 +582,31 @@ def runtime_from_settings(settings: Dynaconf) -> RuntimeSettings:
 def logging_from_settings(settings: Dynaconf) -> LoggingSettings:
     """Extract logging configuration from Dynaconf."""
 
-    level_value = _coerce_str(settings.get(LOGGING_LEVEL_KEY)) or DEFAULT_LOG_LEVEL
+    level_value = _coerce_str(settings.get(LOGGING_LEVEL_KEY))
     format_value = (
         _coerce_str(settings.get(LOGGING_FORMAT_KEY)) or DEFAULT_LOG_FORMAT
     ).lower()
-    if format_value not in {LOG_FORMAT_TEXT, LOG_FORMAT_JSON}:
+    if format_value not in _ALLOWED_LOG_FORMATS:
         raise ValueError(f"Unsupported log format: {format_value}")
 
     file_path = _coerce_str(settings.get(LOGGING_FILE_KEY))
     if is_logfile_disabled_value(file_path):
         file_path = None
 
-    max_bytes_value = _coerce_int(settings.get(LOGGING_MAX_BYTES_KEY))
-    if max_bytes_value is None or max_bytes_value <= 0:
-        max_bytes_value = DEFAULT_MAX_BYTES
-
-    backup_count_value = _coerce_int(settings.get(LOGGING_BACKUP_COUNT_KEY))
-    if backup_count_value is None or backup_count_value <= 0:
-        backup_count_value = DEFAULT_BACKUP_COUNT
+    max_bytes_value = (
+        _coerce_positive_int(settings.get(LOGGING_MAX_BYTES_KEY)) or DEFAULT_MAX_BYTES
+    )
+    backup_count_value = (
+        _coerce_positive_int(settings.get(LOGGING_BACKUP_COUNT_KEY))
+        or DEFAULT_BACKUP_COUNT
+    )
 
-    mapping = logging.getLevelNamesMapping()
-    level_upper = level_value.upper()
-    if level_upper.isdigit():
-        resolved_level = int(level_upper)
+    if level_value is None:
+        resolved_level = _DEFAULT_LEVEL
+    elif level_value.isdigit():
+        resolved_level = int(level_value)
     else:
-        resolved_level = mapping.get(level_upper, logging.INFO)
+        resolved_level = _LEVEL_NAMES_MAPPING.get(level_value.upper(), logging.INFO)
 
     return LoggingSettings(
         level=resolved_level,
@@ -567,7 +625,18 @@ def resolve_birre_settings(
     runtime_inputs: RuntimeInputs | None = None,
     tls_inputs: TlsInputs | None = None,
 ) -> RuntimeSettings:
-    settings = load_settings(config_path)
+    settings = _build_dynaconf(
+        config_path,
+        required_keys=_RUNTIME_SETTINGS_KEYS,
+        overridden_keys=_overridden_keys(
+            api_key_input,
+            (
+                (subscription_inputs, _SUBSCRIPTION_INPUT_SPEC),
+                (runtime_inputs, _RUNTIME_INPUT_SPEC),
+                (tls_inputs, _TLS_INPUT_SPEC),
+            ),
+        ),
+    )
     apply_cli_overrides(
         settings,
         api_key_input=api_key_input,
@@ -587,17 +656,21 @@ def resolve_logging_settings(
     max_bytes_override: int | None = None,
     backup_count_override: int | None = None,
 ) -> LoggingSettings:
-    settings = load_settings(config_path)
-    apply_cli_overrides(
-        settings,
-        logging_inputs=LoggingInputs(
-            level=level_override,
-            format=format_override,
-            file_path=file_override,
-            max_bytes=max_bytes_override,
-            backup_count=backup_count_override,
+    logging_inputs = LoggingInputs(
+        level=level_override,
+        format=format_override,
+        file_path=file_override,
+        max_bytes=max_bytes_override,
+        backup_count=backup_count_override,
+    )
+    settings = _build_dynaconf(
+        config_path,
+        required_keys=_LOGGING_SETTINGS_KEYS,
+        overridden_keys=_overridden_keys(
+            None, ((logging_inputs, _LOGGING_INPUT_SPEC),)
         ),
     )
+    apply_cli_overrides(settings, logging_inputs=logging_inputs)
     return logging_from_settings(settings)
 
 
@@ -610,33 +683,45 @@ def resolve_application_settings(
     logging_inputs: LoggingInputs | None = None,
     tls_inputs: TlsInputs | None = None,
 ) -> tuple[RuntimeSettings, LoggingSettings]:
-    runtime_settings = resolve_birre_settings(
+    # Runtime and logging read disjoint keys, so one Dynaconf instance (and one
+    # parse of each settings file) serves both.
+    settings = _build_dynaconf(
+        config_path,
+        required_keys=_RUNTIME_SETTINGS_KEYS | _LOGGING_SETTINGS_KEYS,
+        overridden_keys=_overridden_keys(
+            api_key_input,
+            (
+                (subscription_inputs, _SUBSCRIPTION_INPUT_SPEC),
+                (runtime_inputs, _RUNTIME_INPUT_SPEC),
+                (tls_inputs, _TLS_INPUT_SPEC),
+                (logging_inputs, _LOGGING_INPUT_SPEC),
+            ),
+        ),
+    )
+    apply_cli_overrides(
+        settings,
         api_key_input=api_key_input,
-        config_path=config_path,
         subscription_inputs=subscription_inputs,
         runtime_inputs=runtime_inputs,
         tls_inputs=tls_inputs,
+        logging_inputs=logging_inputs,
     )
-
-    logging_inputs = logging_inputs or LoggingInputs()
-    logging_settings = resolve_logging_settings(
-        config_path=config_path,
-        **logging_inputs.as_kwargs(),
-    )
+    runtime_settings = runtime_from_settings(settings)
+    logging_settings = logging_from_settings(settings)
 
     if runtime_settings.debug and logging_settings.level > logging.DEBUG:
-        logging_settings = LoggingSettings(
-            level=logging.DEBUG,
-            format=logging_settings.format,
-            file_path=logging_settings.file_path,
-            max_bytes=logging_settings.max_bytes,
-            backup_count=logging_settings.backup_count,
-        )
+        logging_settings = replace(logging_settings, level=logging.DEBUG)
 
     return runtime_settings, logging_settings
 
 
-settings = _build_dynaconf(None)
+def __getattr__(name: str) -> Any:
+    # Build the default ``settings`` instance on first access rather than at
+    # import, so importing constants does not search for .env or read files.
+    if name == "settings":
+        default = globals()["settings"] = _build_dynaconf(None)
+        return default
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
@@ -663,6 +748,5 @@ __all__ = [
     "resolve_birre_settings",
     "resolve_logging_settings",
     "resolve_application_settings",
-    "settings",
     "resolve_config_file_candidates",
 ]
@@ -2,16 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
 import csv
 import io
 import logging
 from collections import defaultdict
-from collections.abc import Callable, Iterable, Sequence
-from dataclasses import dataclass
+from collections.abc import Awaitable, Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass, fields
+from enum import Enum
+from functools import partial
 from typing import Any, cast
 
 from fastmcp import Context, FastMCP
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationError,
+    field_validator,
+    model_validator,
+)
+from pydantic_core import to_json
 
 from birre.config.constants import DEFAULT_CONFIG_FILENAME
 from birre.config.settings import DEFAULT_MAX_FINDINGS
@@ -22,6 +33,32 @@ from birre.domain.folders.utils import resolve_or_create_folder
 from birre.infrastructure.logging import BoundLogger, log_event, log_search_event
 
 MAX_REQUEST_COMPANY_DOMAINS = 255
+BULK_CHUNK_SIZE = 500
+MAX_BULK_GUIDS = 5000
+
+_COMPANY_DETAIL_FIELDS = (
+    "guid,name,description,primary_domain,display_url,homepage,"
+    "people_count,subscription_type,in_spm_portfolio,subscription_end_date,"
+    "current_rating,has_company_tree"
+)
+
+_ACTION_ALIASES: dict[str, str] = {
+    "add": "add",
+    "create": "add",
+    "subscribe": "add",
+    "subscription": "add",
+    "remove": "delete",
+    "delete": "delete",
+    "unsubscribe": "delete",
+}
+_BULK_SUMMARY_KEYS = ("added", "deleted", "modified", "errors")
+_APPLIED_NEXT_STEPS = (
+    "Run `get_company_rating` for a sample GUID to verify post-change access."
+)
+_DRY_RUN_CONFIRMATION = (
+    "Review the payload with the human operator. "
+    "Re-run with dry_run=false to apply changes."
+)
 
 
 class SubscriptionSnapshot(BaseModel):
@@ -106,6 +143,37 @@ class CompanySearchInteractiveResponse(BaseModel):
         return data
 
 
+class _Unset(Enum):
+    """Marks response fields that are omitted from the tool payload."""
+
+    TOKEN = "unset"
+
+
+_UNSET = _Unset.TOKEN
+
+
+def _payload_value(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(exclude_unset=True)
+    if isinstance(value, list):
+        return [_payload_value(item) for item in value]
+    return value
+
+
+def _response_payload(
+    response: RequestCompanyResponse | ManageSubscriptionsResponse,
+) -> dict[str, Any]:
+    if response.error:
+        return {"error": response.error}
+    data: dict[str, Any] = {}
+    for item in fields(response):
+        value = getattr(response, item.name)
+        if value is _UNSET or item.name == "error":
+            continue
+        data[item.name] = _payload_value(value)
+    return data
+
+
 class RequestGuidance(BaseModel):
     next_steps: str | None = None
     confirmation: str | None = None
@@ -121,7 +189,11 @@ class RequestCompanyFailedEntry(BaseModel):
     error: str
 
 
-class RequestCompanyResponse(BaseModel):
+# Schema-of-record for ``request_company``; payloads are built by the dataclass
+# below, which skips pydantic validation for data produced by this module.
+class _RequestCompanyResponseSchema(BaseModel):
+    model_config = ConfigDict(title="RequestCompanyResponse")
+
     error: str | None = None
     status: str | None = None
     submitted: list[str] = Field(default_factory=list)
@@ -136,12 +208,25 @@ class RequestCompanyResponse(BaseModel):
     folder_created: bool | None = None
     result: Any | None = None
 
+
+@dataclass(slots=True)
+class RequestCompanyResponse:
+    error: str | None = None
+    status: str | None | _Unset = _UNSET
+    submitted: list[str] | _Unset = _UNSET
+    already_existing: list[RequestCompanyExistingEntry] | _Unset = _UNSET
+    successfully_requested: list[str] | _Unset = _UNSET
+    failed: list[RequestCompanyFailedEntry] | _Unset = _UNSET
+    dry_run: bool | _Unset = _UNSET
+    csv_preview: str | None | _Unset = _UNSET
+    guidance: RequestGuidance | None | _Unset = _UNSET
+    folder: str | None | _Unset = _UNSET
+    folder_guid: str | None | _Unset = _UNSET
+    folder_created: bool | None | _Unset = _UNSET
+    result: Any | None | _Unset = _UNSET
+
     def to_payload(self) -> dict[str, Any]:
-        if self.error:
-            return {"error": self.error}
-        data = self.model_dump(exclude_unset=True)
-        data.pop("error", None)
-        return data
+        return _response_payload(self)
 
 
 class ManageSubscriptionsGuidance(BaseModel):
@@ -156,7 +241,10 @@ class ManageSubscriptionsSummary(BaseModel):
     errors: list[Any] = Field(default_factory=list)
 
 
-class ManageSubscriptionsResponse(BaseModel):
+# Schema-of-record for ``manage_subscriptions``; see RequestCompanyResponse.
+class _ManageSubscriptionsResponseSchema(BaseModel):
+    model_config = ConfigDict(title="ManageSubscriptionsResponse")
+
     error: str | None = None
     status: str | None = None
     action: str | None = None
@@ -168,12 +256,22 @@ class ManageSubscriptionsResponse(BaseModel):
     guidance: ManageSubscriptionsGuidance | None = None
     summary: ManageSubscriptionsSummary | None = None
 
+
+@dataclass(slots=True)
+class ManageSubscriptionsResponse:
+    error: str | None = None
+    status: str | None | _Unset = _UNSET
+    action: str | None | _Unset = _UNSET
+    guids: list[str] | None | _Unset = _UNSET
+    folder: str | None | _Unset = _UNSET
+    folder_guid: str | None | _Unset = _UNSET
+    folder_created: bool | None | _Unset = _UNSET
+    payload: dict[str, Any] | None | _Unset = _UNSET
+    guidance: ManageSubscriptionsGuidance | None | _Unset = _UNSET
+    summary: ManageSubscriptionsSummary | None | _Unset = _UNSET
+
     def to_payload(self) -> dict[str, Any]:
-        if self.error:
-            return {"error": self.error}
-        data = self.model_dump(exclude_unset=True)
-        data.pop("error", None)
-        return data
+        return _response_payload(self)
 
 
 @dataclass
@@ -189,11 +287,11 @@ COMPANY_SEARCH_INTERACTIVE_OUTPUT_SCHEMA: dict[str, Any] = (
 )
 
 REQUEST_COMPANY_OUTPUT_SCHEMA: dict[str, Any] = (
-    RequestCompanyResponse.model_json_schema()
+    _RequestCompanyResponseSchema.model_json_schema()
 )
 
 MANAGE_SUBSCRIPTIONS_OUTPUT_SCHEMA: dict[str, Any] = (
-    ManageSubscriptionsResponse.model_json_schema()
+    _ManageSubscriptionsResponseSchema.model_json_schema()
 )
 
 
@@ -223,26 +321,22 @@ class CompanySearchDefaults:
     limit: int
 
 
-def _coerce_guid_list(guids: Any) -> list[str]:
+def _coerce_guid_list(guids: Any) -> tuple[str, ...]:
+    """Return stripped GUIDs in first-seen order with duplicates removed."""
     if isinstance(guids, str):
-        return [guid.strip() for guid in guids.split(",") if guid.strip()]
-    if isinstance(guids, Iterable):
-        return [str(item).strip() for item in guids if str(item).strip()]
-    return []
+        items: Iterable[Any] = guids.split(",")
+    elif isinstance(guids, (list, tuple)):
+        items = guids
+    else:
+        try:
+            items = iter(guids)
+        except TypeError:
+            return ()
+    return tuple(dict.fromkeys(guid for item in items if (guid := str(item).strip())))
 
 
 def _normalize_action(value: str) -> str | None:
-    mapping = {
-        "add": "add",
-        "create": "add",
-        "subscribe": "add",
-        "subscription": "add",
-        "remove": "delete",
-        "delete": "delete",
-        "unsubscribe": "delete",
-    }
-    key = value.strip().lower()
-    return mapping.get(key)
+    return _ACTION_ALIASES.get(value.strip().casefold())
 
 
 async def _fetch_company_details(
@@ -256,40 +350,38 @@ async def _fetch_company_details(
     """Retrieve detailed company records for the provided GUIDs.
 
     Requires companies to be already subscribed (via bulk subscription).
+    BitSight offers no batched ``getCompany`` endpoint, so the lookups are
+    issued concurrently and share the pooled connections of the API client.
     """
 
     effective_limit = (
         limit if isinstance(limit, int) and limit > 0 else DEFAULT_MAX_FINDINGS
     )
+    targets = [
+        guid_str
+        for guid in list(guids)[:effective_limit]
+        if guid and (guid_str := str(guid).strip())
+    ]
 
-    details: dict[str, dict[str, Any]] = {}
-    for guid in list(guids)[:effective_limit]:
-        if not guid:
-            continue
-        guid_str = str(guid).strip()
-        if not guid_str:
-            continue
-
-        params = {
-            "guid": guid_str,
-            "fields": (
-                "guid,name,description,primary_domain,display_url,homepage,"
-                "people_count,subscription_type,in_spm_portfolio,subscription_end_date,"
-                "current_rating,has_company_tree"
-            ),
-        }
+    async def fetch(guid_str: str) -> dict[str, Any] | None:
+        params = {"guid": guid_str, "fields": _COMPANY_DETAIL_FIELDS}
         try:
             result = await call_v1_tool("getCompany", ctx, params)
-            if isinstance(result, dict):
-                details[guid_str] = result
         except Exception as exc:  # pragma: no cover - defensive
             await ctx.warning(f"Failed to fetch company details for {guid_str}: {exc}")
             logger.warning(
                 "company_detail.fetch_failed",
                 company_guid=guid_str,
             )
+            return None
+        return result if isinstance(result, dict) else None
 
-    return details
+    results = await asyncio.gather(*(fetch(guid_str) for guid_str in targets))
+    return {
+        guid_str: result
+        for guid_str, result in zip(targets, results, strict=True)
+        if result is not None
+    }
 
 
 async def _fetch_company_tree(
@@ -469,56 +561,45 @@ async def _fetch_folder_memberships(
     return dict(membership)
 
 
-def _normalize_candidate_results(raw_result: Any) -> list[Any]:
-    if isinstance(raw_result, dict):
-        for key in ("results", "companies"):
-            value = raw_result.get(key)
-            if isinstance(value, list):
-                return value
-        return [raw_result]
+def _extract_search_candidates(raw_result: Any) -> Iterator[dict[str, Any]]:
+    entries: Iterable[Any]
     if isinstance(raw_result, list):
-        return raw_result
-    return []
-
-
-def _build_candidate(entry: Any) -> dict[str, Any | None] | None:
-    if not isinstance(entry, dict):
-        return None
-
-    details_raw = entry.get("details")
-    details: dict[str, Any] = details_raw if isinstance(details_raw, dict) else {}
-    primary_domain = (
-        entry.get("primary_domain")
-        or entry.get("domain")
-        or entry.get("display_url")
-        or ""
-    )
-    website = (
-        entry.get("company_url")
-        or entry.get("homepage")
-        or entry.get("website")
-        or primary_domain
-    )
-
-    return {
-        "guid": entry.get("guid"),
-        "name": entry.get("name") or entry.get("display_name"),
-        "primary_domain": primary_domain,
-        "website": website,
-        "description": entry.get("description") or entry.get("business_description"),
-        "employee_count": details.get("employee_count") or entry.get("people_count"),
-        "in_portfolio": details.get("in_portfolio") or entry.get("in_portfolio"),
-        "subscription_type": entry.get("subscription_type"),
-    }
-
+        entries = raw_result
+    elif isinstance(raw_result, dict):
+        results = raw_result.get("results")
+        if not isinstance(results, list):
+            results = raw_result.get("companies")
+        entries = results if isinstance(results, list) else (raw_result,)
+    else:
+        return
 
-def _extract_search_candidates(raw_result: Any) -> list[dict[str, Any]]:
-    candidates: list[dict[str, Any]] = []
-    for entry in _normalize_candidate_results(raw_result):
-        candidate = _build_candidate(entry)
-        if candidate is not None:
-            candidates.append(candidate)
-    return candidates
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        details = entry.get("details")
+        if not isinstance(details, dict):
+            details = {}
+        primary_domain = (
+            entry.get("primary_domain")
+            or entry.get("domain")
+            or entry.get("display_url")
+            or ""
+        )
+        yield {
+            "guid": entry.get("guid"),
+            "name": entry.get("name") or entry.get("display_name"),
+            "primary_domain": primary_domain,
+            "website": entry.get("company_url")
+            or entry.get("homepage")
+            or entry.get("website")
+            or primary_domain,
+            "description": entry.get("description")
+            or entry.get("business_description"),
+            "employee_count": details.get("employee_count")
+            or entry.get("people_count"),
+            "in_portfolio": details.get("in_portfolio") or entry.get("in_portfolio"),
+            "subscription_type": entry.get("subscription_type"),
+        }
 
 
 def _build_subscription_snapshot(
@@ -766,18 +847,19 @@ async def _build_company_search_response(
     defaults: CompanySearchDefaults,
 ) -> CompanySearchInteractiveResponse:
     """Build comprehensive search response with company details, trees, and parents."""
-    candidates = _extract_search_candidates(raw_result)
+    log_success = partial(
+        log_search_event,
+        logger,
+        "success",
+        ctx=ctx,
+        company_name=search.name,
+        company_domain=search.domain,
+    )
+    candidates = list(_extract_search_candidates(raw_result))
     guid_order = _build_guid_order(candidates)
 
     if not guid_order:
-        log_search_event(
-            logger,
-            "success",
-            ctx=ctx,
-            company_name=search.name,
-            company_domain=search.domain,
-            result_count=0,
-        )
+        log_success(result_count=0)
         return _build_empty_search_response(
             search.term,
             default_folder=defaults.folder,
@@ -849,14 +931,7 @@ async def _build_company_search_response(
         )
 
         result_count = len(enriched)
-        log_search_event(
-            logger,
-            "success",
-            ctx=ctx,
-            company_name=search.name,
-            company_domain=search.domain,
-            result_count=result_count,
-        )
+        log_success(result_count=result_count)
     finally:
         await _bulk_unsubscribe_companies(
             call_v1_tool,
@@ -1200,34 +1275,20 @@ def _parse_domain_string(
     ctx: Context,
 ) -> tuple[list[str], dict[str, Any | None] | None]:
     """Parse the CLI comma-separated domain list (not a CSV file)."""
+    warn = partial(log_event, logger, level=logging.WARNING, ctx=ctx)
     raw_value = (comma_separated_domains or "").strip()
     if not raw_value:
-        log_event(
-            logger,
-            "company_request.invalid_domain_input",
-            level=logging.WARNING,
-            ctx=ctx,
-            domains=comma_separated_domains,
-        )
+        warn("company_request.invalid_domain_input", domains=comma_separated_domains)
         return [], {"error": "Provide at least one domain"}
 
     tokens = [token.strip().lower() for token in raw_value.split(",") if token.strip()]
     if not tokens:
-        log_event(
-            logger,
-            "company_request.invalid_domain_input",
-            level=logging.WARNING,
-            ctx=ctx,
-            domains=comma_separated_domains,
-        )
+        warn("company_request.invalid_domain_input", domains=comma_separated_domains)
         return [], {"error": "Provide at least one valid domain"}
 
     if len(tokens) > MAX_REQUEST_COMPANY_DOMAINS:
-        log_event(
-            logger,
+        warn(
             "company_request.domain_limit_exceeded",
-            level=logging.WARNING,
-            ctx=ctx,
             count=len(tokens),
             limit=MAX_REQUEST_COMPANY_DOMAINS,
         )
@@ -1237,13 +1298,7 @@ def _parse_domain_string(
 
     invalid = [token for token in tokens if " " in token or "." not in token]
     if invalid:
-        log_event(
-            logger,
-            "company_request.invalid_domain_token",
-            level=logging.WARNING,
-            ctx=ctx,
-            invalid=invalid[:5],
-        )
+        warn("company_request.invalid_domain_token", invalid=invalid[:5])
         return [], {
             "error": f"Invalid domain entries: {', '.join(invalid[:5])}",
         }
@@ -1305,10 +1360,7 @@ async def _initialize_request_company_state(
 ) -> tuple[RequestCompanyState | None, dict[str, Any] | None]:
     submitted_domains, error = _parse_domain_string(domains, logger=logger, ctx=ctx)
     if error:
-        return (
-            None,
-            RequestCompanyResponse(error=error["error"]).to_payload(),
-        )
+        return None, {"error": error["error"]}
 
     unique_domains, duplicates = _deduplicate_domains(submitted_domains)
     existing_order: list[str] = []
@@ -1402,8 +1454,6 @@ async def _resolve_request_company_folder(
     selected_folder: str | None,
     default_folder: str | None,
     default_folder_guid: str | None,
-    submitted_domains: Sequence[str],
-    existing_entries: list[RequestCompanyExistingEntry],
     allow_create: bool,
 ) -> tuple[str | None, bool, dict[str, Any] | None, str | None]:
     if not selected_folder:
@@ -1423,20 +1473,7 @@ async def _resolve_request_company_folder(
     if folder_result.error:
         if not allow_create:
             return None, False, None, folder_result.error
-        return (
-            None,
-            False,
-            RequestCompanyResponse(
-                error=folder_result.error,
-                status="folder_error",
-                submitted=list(submitted_domains),
-                already_existing=existing_entries,
-                successfully_requested=[],
-                failed=[],
-                folder=selected_folder,
-            ).to_payload(),
-            None,
-        )
+        return None, False, {"error": folder_result.error}, None
 
     return folder_result.guid, folder_result.created, None, None
 
@@ -1595,9 +1632,6 @@ async def _submit_request_company_bulk(
     remaining_domains: Sequence[str],
     selected_folder: str | None,
     folder_guid: str | None,
-    submitted_domains: Sequence[str],
-    existing_entries: list[RequestCompanyExistingEntry],
-    folder_created: bool,
     csv_body: str,
 ) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
     bulk_payload = _build_bulk_payload(csv_body, folder_guid)
@@ -1613,21 +1647,7 @@ async def _submit_request_company_bulk(
             folder=selected_folder,
             error=str(exc),
         )
-        failed_entries = [
-            RequestCompanyFailedEntry(domain=domain, error=str(exc))
-            for domain in remaining_domains
-        ]
-        return None, RequestCompanyResponse(
-            error=str(exc),
-            status="failed",
-            submitted=list(submitted_domains),
-            already_existing=existing_entries,
-            successfully_requested=[],
-            failed=failed_entries,
-            folder=selected_folder,
-            folder_guid=folder_guid,
-            folder_created=folder_created or None,
-        ).to_payload()
+        return None, {"error": str(exc)}
 
     log_event(
         logger,
@@ -1712,8 +1732,6 @@ async def _maybe_resolve_request_company_folder(
         selected_folder=state.selected_folder,
         default_folder=default_folder,
         default_folder_guid=default_folder_guid,
-        submitted_domains=state.submitted_domains,
-        existing_entries=state.existing_entries,
         allow_create=not dry_run,
     )
     if folder_error is not None:
@@ -1841,9 +1859,6 @@ def register_request_company_tool(
             remaining_domains=state.remaining_domains,
             selected_folder=state.selected_folder,
             folder_guid=state.folder_guid,
-            submitted_domains=state.submitted_domains,
-            existing_entries=state.existing_entries,
-            folder_created=state.folder_created,
             csv_body=state.csv_body,
         )
         if failure_payload is not None:
@@ -1891,12 +1906,67 @@ def _build_subscription_payload(
 def _summarize_bulk_result(result: Any) -> dict[str, Any]:
     if not isinstance(result, dict):
         return {"raw": result}
-    return {
-        "added": result.get("added", []),
-        "deleted": result.get("deleted", []),
-        "modified": result.get("modified", []),
-        "errors": result.get("errors", []),
-    }
+    return {key: result.get(key, []) for key in _BULK_SUMMARY_KEYS}
+
+
+def _summary_model(summary: dict[str, Any]) -> ManageSubscriptionsSummary:
+    """Return the summary model, validating only when fields are not plain lists."""
+    if all(type(summary.get(key, [])) is list for key in _BULK_SUMMARY_KEYS):
+        return ManageSubscriptionsSummary.model_construct(
+            **{key: summary[key] for key in _BULK_SUMMARY_KEYS if key in summary}
+        )
+    return ManageSubscriptionsSummary.model_validate(summary)
+
+
+def _chunks(items: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _chunk_subscription_payload(payload: dict[str, Any]) -> list[dict[str, Any]]:
+    """Split a bulk payload into windows of at most ``BULK_CHUNK_SIZE`` entries."""
+    return [
+        {action: list(window)}
+        for action, entries in payload.items()
+        for window in _chunks(entries, BULK_CHUNK_SIZE)
+    ]
+
+
+def _merge_bulk_summaries(
+    summaries: Iterable[tuple[list[str], dict[str, Any]]],
+    failures: Iterable[dict[str, Any]] = (),
+) -> dict[str, Any]:
+    """Merge per-window summaries keyed by the GUIDs each window carried.
+
+    A window whose response is not a summary, or whose fields are not lists, is
+    listed under ``errors`` with its GUIDs instead of being dropped or spread
+    into the merged lists.
+    """
+    merged: dict[str, list[Any]] = {key: [] for key in _BULK_SUMMARY_KEYS}
+    errors = merged["errors"]
+    for guids, summary in summaries:
+        if "raw" in summary:
+            errors.append(
+                {"guids": guids, "error": "Unexpected manageSubscriptionsBulk response"}
+            )
+            continue
+        try:
+            validated = ManageSubscriptionsSummary.model_validate(summary)
+        except ValidationError as exc:
+            errors.append(
+                {
+                    "guids": guids,
+                    "error": (
+                        "Malformed manageSubscriptionsBulk summary: "
+                        f"{exc.error_count()} invalid field(s)"
+                    ),
+                }
+            )
+            continue
+        for key, bucket in merged.items():
+            bucket.extend(getattr(validated, key))
+    errors.extend(failures)
+    return merged
 
 
 def _manage_subscriptions_error(message: str) -> dict[str, Any]:
@@ -1909,10 +1979,8 @@ def _build_manage_subscriptions_success_response(
     guid_list: Sequence[str],
     target_folder: str | None,
     folder_state: ManageSubscriptionsFolderState,
-    result: Any,
+    summary: dict[str, Any],
 ) -> dict[str, Any]:
-    summary = _summarize_bulk_result(result)
-    summary_model = ManageSubscriptionsSummary.model_validate(summary)
     return ManageSubscriptionsResponse(
         status="applied",
         action=normalized_action,
@@ -1920,49 +1988,47 @@ def _build_manage_subscriptions_success_response(
         folder=target_folder,
         folder_guid=folder_state.folder_guid,
         folder_created=folder_state.folder_created or None,
-        summary=summary_model,
-        guidance=ManageSubscriptionsGuidance(
-            next_steps=(
-                "Run `get_company_rating` for a sample GUID to verify post-change access."
-            )
-        ),
+        guidance=ManageSubscriptionsGuidance(next_steps=_APPLIED_NEXT_STEPS),
+        summary=_summary_model(summary),
     ).to_payload()
 
 
+_ERROR_PAYLOADS: dict[str, dict[str, Any]] = {
+    "bad_action": _manage_subscriptions_error(
+        "Unsupported action. Use one of: add, subscribe, remove, delete, unsubscribe"
+    ),
+    "no_guids": _manage_subscriptions_error(
+        "At least one company GUID must be supplied"
+    ),
+    "too_many": _manage_subscriptions_error(
+        f"Provide at most {MAX_BULK_GUIDS} company GUIDs per request"
+    ),
+    "no_type": _manage_subscriptions_error(
+        "Subscription type is not configured. Provide a subscription_type via CLI "
+        "arguments, set BIRRE_SUBSCRIPTION_TYPE in the environment, or update "
+        f"{DEFAULT_CONFIG_FILENAME}."
+    ),
+}
+
+
 def _validate_manage_subscriptions_inputs(
     action: str,
     guids: Sequence[str],
     *,
     default_type: str | None,
-) -> tuple[str | None, list[str], dict[str, Any | None] | None]:
+) -> tuple[str | None, tuple[str, ...], dict[str, Any | None] | None]:
     normalized_action = _normalize_action(action)
     if normalized_action is None:
-        return (
-            None,
-            [],
-            _manage_subscriptions_error(
-                "Unsupported action. Use one of: add, subscribe, remove, delete, unsubscribe"
-            ),
-        )
+        return None, (), dict(_ERROR_PAYLOADS["bad_action"])
 
     guid_list = _coerce_guid_list(guids)
     if not guid_list:
-        return (
-            None,
-            [],
-            _manage_subscriptions_error("At least one company GUID must be supplied"),
-        )
+        return None, (), dict(_ERROR_PAYLOADS["no_guids"])
+    if len(guid_list) > MAX_BULK_GUIDS:
+        return None, (), dict(_ERROR_PAYLOADS["too_many"])
 
     if normalized_action == "add" and not default_type:
-        return (
-            None,
-            [],
-            _manage_subscriptions_error(
-                "Subscription type is not configured. Provide a subscription_type via CLI "
-                "arguments, set BIRRE_SUBSCRIPTION_TYPE in the environment, or update "
-                f"{DEFAULT_CONFIG_FILENAME}."
-            ),
-        )
+        return None, (), dict(_ERROR_PAYLOADS["no_type"])
 
     return normalized_action, guid_list, None
 
@@ -1977,12 +2043,7 @@ def _manage_subscriptions_dry_run_response(
     payload: dict[str, Any],
     pending_folder_reason: str | None,
 ) -> dict[str, Any]:
-    guidance = ManageSubscriptionsGuidance(
-        confirmation=(
-            "Review the payload with the human operator. \
-                Re-run with dry_run=false to apply changes."
-        )
-    )
+    guidance = ManageSubscriptionsGuidance(confirmation=_DRY_RUN_CONFIRMATION)
     if pending_folder_reason:
         guidance.next_steps = pending_folder_reason
 
@@ -2029,33 +2090,123 @@ async def _resolve_manage_subscriptions_folder(
     return folder_result.guid, folder_result.created, None, None
 
 
+async def _report_manage_subscriptions_failure(
+    ctx: Context,
+    logger: BoundLogger,
+    exc: Exception,
+    *,
+    detail: str,
+    count: int,
+) -> None:
+    await ctx.error(f"Subscription management failed: {detail}")
+    logger_obj = getattr(logger, "_logger", None)
+    exc_info = exc if logger_obj and logger_obj.isEnabledFor(logging.DEBUG) else False
+    logger.error("manage_subscriptions.failed", count=count, exc_info=exc_info)
+
+
+_BulkResults = list[tuple[dict[str, Any], Any]]
+# In-flight submissions of one registered tool, keyed on the encoded payload.
+_BulkInflight = dict[bytes, asyncio.Future[_BulkResults]]
+
+
+async def _submit_bulk_windows(
+    call_v1_tool: CallV1Tool,
+    ctx: Context,
+    payload: dict[str, Any],
+) -> _BulkResults:
+    """Send the payload in concurrent windows; pair each window with its outcome.
+
+    Failed windows carry their exception as the outcome. Nothing is reported
+    here because the submission may be shared between several callers.
+    """
+    windows = _chunk_subscription_payload(payload)
+    outcomes = await asyncio.gather(
+        *(call_v1_tool("manageSubscriptionsBulk", ctx, window) for window in windows),
+        return_exceptions=True,
+    )
+    return list(zip(windows, outcomes, strict=True))
+
+
+async def _submit_bulk_once(
+    inflight: _BulkInflight,
+    key: bytes,
+    submit: Callable[[], Awaitable[_BulkResults]],
+) -> _BulkResults:
+    """Share one upstream submission between concurrent identical requests.
+
+    The first caller starts the submission; callers arriving with the same key
+    while it is in flight await the same future. The shared future is shielded
+    so a cancelled caller does not abort the submission for the others.
+    ``inflight`` belongs to one registered tool, so only callers going through
+    the same bridge (and credentials) ever share a submission.
+    """
+    future = inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(submit())
+        inflight[key] = future
+
+        def _release(done: asyncio.Future[_BulkResults]) -> None:
+            inflight.pop(key, None)
+            if not done.cancelled():
+                done.exception()  # mark retrieved even if every caller went away
+
+        future.add_done_callback(_release)
+    return await asyncio.shield(future)
+
+
 async def _perform_manage_subscriptions_bulk(
     call_v1_tool: CallV1Tool,
     ctx: Context,
     payload: dict[str, Any],
     action: str,
-    guids: Sequence[str],
     logger: BoundLogger,
-) -> tuple[Any | None, dict[str, Any] | None]:
-    try:
-        result = await call_v1_tool("manageSubscriptionsBulk", ctx, payload)
-    except Exception as exc:
-        await ctx.error(f"Subscription management failed: {exc}")
-        logger_obj = getattr(logger, "_logger", None)
-        exc_info = (
-            exc if logger_obj and logger_obj.isEnabledFor(logging.DEBUG) else False
-        )
-        logger.error(
-            "manage_subscriptions.failed",
-            action=action,
-            count=len(guids),
-            exc_info=exc_info,
-        )
-        return None, ManageSubscriptionsResponse(
-            error=f"manageSubscriptionsBulk failed: {exc}"
-        ).to_payload()
+    *,
+    inflight: _BulkInflight,
+) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+    """Submit the payload in concurrent windows and merge their summaries.
+
+    Identical payloads already in flight on ``inflight`` are joined rather
+    than resubmitted.
+    Failures are reported on this caller's ``ctx`` and logger. A window that
+    fails is listed under ``errors`` with the GUIDs it carried, so the changes
+    applied by the other windows are not hidden. Only when every window fails
+    is the call treated as an error.
+    """
+    results = await _submit_bulk_once(
+        inflight,
+        to_json(payload),
+        lambda: _submit_bulk_windows(call_v1_tool, ctx, payload),
+    )
 
-    return result, None
+    summaries: list[tuple[list[str], dict[str, Any]]] = []
+    failures: list[dict[str, Any]] = []
+    first_detail: str | None = None
+    failure_logger: BoundLogger | None = None
+    for window, outcome in results:
+        entries = window[action]
+        guids = [entry["guid"] for entry in entries]
+        if isinstance(outcome, BaseException):
+            if not isinstance(outcome, Exception):
+                raise outcome
+            detail = str(outcome)
+            if failure_logger is None:
+                failure_logger = logger.bind(action=action)
+            await _report_manage_subscriptions_failure(
+                ctx, failure_logger, outcome, detail=detail, count=len(entries)
+            )
+            if first_detail is None:
+                first_detail = detail
+            failures.append({"guids": guids, "error": detail})
+            continue
+        summaries.append((guids, _summarize_bulk_result(outcome)))
+
+    if not summaries and first_detail is not None:
+        return None, _manage_subscriptions_error(
+            f"manageSubscriptionsBulk failed: {first_detail}"
+        )
+    if len(results) == 1:
+        return summaries[0][1], None
+    return _merge_bulk_summaries(summaries, failures), None
 
 
 def _maybe_return_manage_subscriptions_dry_run(
@@ -2064,10 +2215,16 @@ def _maybe_return_manage_subscriptions_dry_run(
     normalized_action: str,
     guid_list: Sequence[str],
     folder_state: ManageSubscriptionsFolderState,
-    payload: dict[str, Any],
+    subscription_type: str | None,
 ) -> dict[str, Any] | None:
     if not dry_run:
         return None
+    payload = _build_subscription_payload(
+        normalized_action,
+        guid_list,
+        folder_guid=folder_state.folder_guid,
+        subscription_type=subscription_type,
+    )
     return _manage_subscriptions_dry_run_response(
         action=normalized_action,
         guids=guid_list,
@@ -2089,29 +2246,31 @@ async def _apply_manage_subscriptions_changes(
     logger: BoundLogger,
     target_folder: str | None,
     folder_state: ManageSubscriptionsFolderState,
+    inflight: _BulkInflight,
 ) -> dict[str, Any]:
     await ctx.info(
         f"Executing manageSubscriptionsBulk action={normalized_action} "
         f"for {len(guid_list)} companies"
     )
 
-    result, error_payload = await _perform_manage_subscriptions_bulk(
+    summary, error_payload = await _perform_manage_subscriptions_bulk(
         call_v1_tool,
         ctx,
         payload,
         normalized_action,
-        guid_list,
         logger,
+        inflight=inflight,
     )
     if error_payload is not None:
         return error_payload
+    assert summary is not None, "Summary must be available when no error is returned."
 
     return _build_manage_subscriptions_success_response(
         normalized_action=normalized_action,
         guid_list=guid_list,
         target_folder=target_folder,
         folder_state=folder_state,
-        result=result,
+        summary=summary,
     )
 
 
@@ -2124,6 +2283,8 @@ def register_manage_subscriptions_tool(
     default_folder_guid: str | None = None,
     default_type: str | None,
 ) -> Callable[..., Any]:
+    inflight: _BulkInflight = {}
+
     async def manage_subscriptions(
         ctx: Context,
         action: str,
@@ -2136,7 +2297,8 @@ def register_manage_subscriptions_tool(
 
         Parameters
         - action: Desired change; accepts add/subscribe or delete/unsubscribe.
-        - guids: Iterable of BitSight company GUIDs to modify.
+        - guids: Iterable of BitSight company GUIDs to modify (max 5000 unique
+            GUIDs per call; split larger batches across calls).
         - folder: Optional folder to apply when subscribing (defaults to context).
         - dry_run: When True, return the planned payload instead of executing.
 
@@ -2201,23 +2363,23 @@ def register_manage_subscriptions_tool(
         if folder_error is not None:
             return folder_error
 
-        payload = _build_subscription_payload(
-            normalized_action,
-            guid_list,
-            folder_guid=folder_state.folder_guid,
-            subscription_type=default_type,
-        )
-
         dry_run_payload = _maybe_return_manage_subscriptions_dry_run(
             dry_run=dry_run,
             normalized_action=normalized_action,
             guid_list=guid_list,
             folder_state=folder_state,
-            payload=payload,
+            subscription_type=default_type,
         )
         if dry_run_payload is not None:
             return dry_run_payload
 
+        payload = _build_subscription_payload(
+            normalized_action,
+            guid_list,
+            folder_guid=folder_state.folder_guid,
+            subscription_type=default_type,
+        )
+
         return await _apply_manage_subscriptions_changes(
             call_v1_tool=call_v1_tool,
             ctx=ctx,
@@ -2227,6 +2389,7 @@ def register_manage_subscriptions_tool(
             logger=logger,
             target_folder=target_folder,
             folder_state=folder_state,
+            inflight=inflight,
         )
 
     return business_server.tool(output_schema=MANAGE_SUBSCRIPTIONS_OUTPUT_SCHEMA)(
@@ -14,8 +14,6 @@ async def test_resolve_request_company_folder_uses_cached_guid() -> None:
         selected_folder="Managed",
         default_folder="Managed",
         default_folder_guid="cached-guid",
-        submitted_domains=["example.com"],
-        existing_entries=[],
         allow_create=True,
     )
 
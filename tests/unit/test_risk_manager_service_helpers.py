@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from dataclasses import fields
 from typing import Any
 
 import pytest
@@ -40,8 +41,11 @@ class StubContext(Context):
 
 
 def test_guid_and_search_helpers() -> None:
-    assert risk_service._coerce_guid_list("a , b,,") == ["a", "b"]
-    assert risk_service._coerce_guid_list(["x", " ", 5]) == ["x", "5"]
+    assert risk_service._coerce_guid_list(g for g in (" y ", "")) == ("y",)
+    assert risk_service._coerce_guid_list(None) == ()
+    assert risk_service._coerce_guid_list("a , b,,") == ("a", "b")
+    assert risk_service._coerce_guid_list(["x", " ", 5]) == ("x", "5")
+    assert risk_service._coerce_guid_list("b, a, b , a") == ("b", "a")
     assert risk_service._normalize_action("Subscribe") == "add"
     assert risk_service._normalize_action("UNSUBSCRIBE") == "delete"
     assert risk_service._normalize_action("noop") is None
@@ -126,7 +130,7 @@ def test_candidate_extraction_and_enrichment() -> None:
             }
         ]
     }
-    candidates = risk_service._extract_search_candidates(raw)
+    candidates = list(risk_service._extract_search_candidates(raw))
     candidate = candidates[0]
     detail = {
         "guid": "guid-1",
@@ -161,10 +165,16 @@ def test_candidate_extraction_and_enrichment() -> None:
     )
     assert non_subscribed == ["guid-1"]
 
-    assert risk_service._normalize_candidate_results({"companies": [1, 2]}) == [1, 2]
-    assert risk_service._normalize_candidate_results({"unexpected": 5}) == [
-        {"unexpected": 5}
-    ]
+    companies = list(
+        risk_service._extract_search_candidates(
+            {"companies": [1, {"guid": "guid-3", "domain": "c.io"}]}
+        )
+    )
+    assert [entry["guid"] for entry in companies] == ["guid-3"]
+    assert companies[0]["website"] == "c.io"
+    fallback = list(risk_service._extract_search_candidates({"unexpected": 5}))
+    assert len(fallback) == 1 and fallback[0]["guid"] is None
+    assert list(risk_service._extract_search_candidates("oops")) == []
 
 
 @pytest.mark.asyncio
@@ -282,7 +292,16 @@ def test_subscription_payload_and_validation_errors() -> None:
             "delete", ["g1"], default_type=None
         )
     )
-    assert action == "delete" and guids == ["g1"] and validation_error is None
+    assert action == "delete" and guids == ("g1",) and validation_error is None
+
+    too_many = [f"g{index}" for index in range(risk_service.MAX_BULK_GUIDS + 1)]
+    action, guids, validation_error = (
+        risk_service._validate_manage_subscriptions_inputs(
+            "delete", too_many, default_type=None
+        )
+    )
+    assert action is None and guids == ()
+    assert str(risk_service.MAX_BULK_GUIDS) in validation_error["error"]
 
 
 def test_parse_domain_string_and_deduplicate() -> None:
@@ -613,3 +632,240 @@ def test_serialize_and_build_bulk_payload() -> None:
     payload = risk_service._build_bulk_payload(csv_body, "folder-1")
     assert payload["file"].splitlines()[:3] == ["domain", "one.com", "two.com"]
     assert payload["folder_guid"] == "folder-1"
+
+
+def test_response_payload_keeps_explicit_none_and_skips_unset() -> None:
+    response = risk_service.RequestCompanyResponse(
+        status="dry_run",
+        already_existing=[risk_service.RequestCompanyExistingEntry(domain="dup")],
+        folder_guid=None,
+        guidance=risk_service.RequestGuidance(next_steps="check"),
+    )
+    assert response.to_payload() == {
+        "status": "dry_run",
+        "already_existing": [{"domain": "dup"}],
+        "folder_guid": None,
+        "guidance": {"next_steps": "check"},
+    }
+    assert risk_service.ManageSubscriptionsResponse(
+        error="boom", status="applied"
+    ).to_payload() == {"error": "boom"}
+    assert (
+        risk_service.MANAGE_SUBSCRIPTIONS_OUTPUT_SCHEMA["title"]
+        == "ManageSubscriptionsResponse"
+    )
+
+
+@pytest.mark.parametrize(
+    ("response_cls", "schema_cls"),
+    [
+        (
+            risk_service.RequestCompanyResponse,
+            risk_service._RequestCompanyResponseSchema,
+        ),
+        (
+            risk_service.ManageSubscriptionsResponse,
+            risk_service._ManageSubscriptionsResponseSchema,
+        ),
+    ],
+)
+def test_response_dataclass_matches_output_schema(
+    response_cls: type[Any], schema_cls: type[Any]
+) -> None:
+    assert {field.name for field in fields(response_cls)} == set(
+        schema_cls.model_fields
+    )
+
+
+@pytest.mark.asyncio
+async def test_fetch_company_details_issues_lookups_concurrently() -> None:
+    logger = get_logger("test.details")
+    ctx = StubContext()
+    in_flight = 0
+    peak = 0
+
+    async def call_v1(
+        tool_name: str, _ctx: Context, params: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        nonlocal in_flight, peak
+        assert tool_name == "getCompany"
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return None if params["guid"] == "g2" else {"guid": params["guid"]}
+
+    details = await risk_service._fetch_company_details(
+        call_v1,
+        ctx,
+        ["g1", " ", "g2", "g3", "g4"],
+        logger=logger,
+        limit=4,
+    )
+    assert list(details) == ["g1", "g3"]
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_perform_manage_subscriptions_bulk_chunks_and_merges(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(risk_service, "BULK_CHUNK_SIZE", 2)
+    logger = get_logger("test.bulk")
+    ctx = StubContext()
+    windows: list[list[str]] = []
+
+    async def call_v1(
+        tool_name: str, _ctx: Context, params: dict[str, Any]
+    ) -> dict[str, Any]:
+        assert tool_name == "manageSubscriptionsBulk"
+        guids = [entry["guid"] for entry in params["delete"]]
+        windows.append(guids)
+        if "g3" in guids:
+            raise RuntimeError("upstream down")
+        return {"deleted": guids}
+
+    payload = risk_service._build_subscription_payload(
+        "delete",
+        ["g1", "g2", "g3", "g4", "g5"],
+        folder_guid=None,
+        subscription_type=None,
+    )
+    summary, error = await risk_service._perform_manage_subscriptions_bulk(
+        call_v1, ctx, payload, "delete", logger, inflight={}
+    )
+    assert error is None
+    assert windows == [["g1", "g2"], ["g3", "g4"], ["g5"]]
+    assert summary == {
+        "added": [],
+        "deleted": ["g1", "g2", "g5"],
+        "modified": [],
+        "errors": [{"guids": ["g3", "g4"], "error": "upstream down"}],
+    }
+    assert ctx.errors == ["Subscription management failed: upstream down"]
+
+
+def test_merge_bulk_summaries_reports_malformed_windows() -> None:
+    merged = risk_service._merge_bulk_summaries(
+        [
+            (["g1"], {"added": ["g1"], "deleted": [], "modified": [], "errors": []}),
+            (["g2"], {"raw": "oops"}),
+            (["g3"], {"added": "g3", "deleted": [], "modified": [], "errors": []}),
+        ],
+        [{"guids": ["g4"], "error": "upstream down"}],
+    )
+    assert merged["added"] == ["g1"]
+    assert merged["deleted"] == merged["modified"] == []
+    assert [entry["guids"] for entry in merged["errors"]] == [["g2"], ["g3"], ["g4"]]
+    assert merged["errors"][0]["error"] == "Unexpected manageSubscriptionsBulk response"
+    assert merged["errors"][1]["error"].startswith(
+        "Malformed manageSubscriptionsBulk summary"
+    )
+
+
+@pytest.mark.asyncio
+async def test_submit_bulk_once_shares_in_flight_calls() -> None:
+    calls = 0
+    release = asyncio.Event()
+
+    async def submit() -> list[tuple[dict[str, Any], Any]]:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return [({"add": []}, {"added": ["g1"]})]
+
+    inflight: dict[bytes, Any] = {}
+    first = asyncio.ensure_future(
+        risk_service._submit_bulk_once(inflight, b"k", submit)
+    )
+    second = asyncio.ensure_future(
+        risk_service._submit_bulk_once(inflight, b"k", submit)
+    )
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await first == await second == [({"add": []}, {"added": ["g1"]})]
+    assert calls == 1
+    assert inflight == {}
+
+    await risk_service._submit_bulk_once(inflight, b"k", submit)
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_joined_bulk_submission_reports_to_each_caller() -> None:
+    logger = get_logger("test.bulk.join")
+    calls = 0
+    release = asyncio.Event()
+
+    async def call_v1(
+        tool_name: str, _ctx: Context, params: dict[str, Any]
+    ) -> dict[str, Any]:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        raise RuntimeError("upstream down")
+
+    payload = risk_service._build_subscription_payload(
+        "delete", ["g1"], folder_guid=None, subscription_type=None
+    )
+    first_ctx, second_ctx = StubContext(), StubContext()
+    inflight: dict[bytes, Any] = {}
+    first = asyncio.ensure_future(
+        risk_service._perform_manage_subscriptions_bulk(
+            call_v1, first_ctx, payload, "delete", logger, inflight=inflight
+        )
+    )
+    second = asyncio.ensure_future(
+        risk_service._perform_manage_subscriptions_bulk(
+            call_v1, second_ctx, dict(payload), "delete", logger, inflight=inflight
+        )
+    )
+    await asyncio.sleep(0)
+    release.set()
+
+    expected = (None, {"error": "manageSubscriptionsBulk failed: upstream down"})
+    assert await first == await second == expected
+    assert calls == 1
+    assert first_ctx.errors == ["Subscription management failed: upstream down"]
+    assert second_ctx.errors == first_ctx.errors
+
+
+def test_dry_run_response_includes_the_planned_payload() -> None:
+    state = risk_service.ManageSubscriptionsFolderState(
+        folder="Ops", folder_guid="folder-1"
+    )
+    kwargs: dict[str, Any] = {
+        "dry_run": True,
+        "normalized_action": "add",
+        "guid_list": ("g1", "g2"),
+        "folder_state": state,
+        "subscription_type": "managed",
+    }
+    response = risk_service._maybe_return_manage_subscriptions_dry_run(**kwargs)
+
+    assert response is not None and response["payload"]["add"][1] == {
+        "guid": "g2",
+        "type": "managed",
+        "folder": ["folder-1"],
+    }
+    assert response["guids"] == ["g1", "g2"]
+    assert (
+        risk_service._maybe_return_manage_subscriptions_dry_run(
+            **{**kwargs, "dry_run": False}
+        )
+        is None
+    )
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        risk_service.CompanySearchInteractiveResponse,
+        risk_service.ManageSubscriptionsSummary,
+        risk_service.RequestCompanyExistingEntry,
+        risk_service.RequestCompanyFailedEntry,
+    ],
+)
+def test_response_models_are_built_at_import(model: type) -> None:
+    assert model.__pydantic_complete__
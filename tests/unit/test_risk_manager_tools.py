@@ -1,3 +1,4 @@
+import asyncio
 from collections.abc import Callable
 from typing import Any
 
@@ -9,6 +10,7 @@ from birre.domain.risk_manager import (
     register_manage_subscriptions_tool,
     register_request_company_tool,
 )
+from birre.domain.risk_manager.service import MAX_BULK_GUIDS
 from birre.infrastructure.logging import get_logger
 
 
@@ -208,6 +210,58 @@ async def test_manage_subscriptions_dry_run_reports_missing_folder() -> None:
     assert "folder" not in result["payload"]["add"][0]
 
 
+def test_manage_subscriptions_description_states_guid_limit() -> None:
+    tool = register_manage_subscriptions_tool(
+        FastMCP(name="TestServer"),
+        BridgeStub({}),
+        logger=get_logger("test.manage_subscriptions"),
+        default_folder=None,
+        default_type=None,
+    )
+
+    assert f"max {MAX_BULK_GUIDS} unique" in (tool.__doc__ or "")
+
+
+@pytest.mark.asyncio
+async def test_manage_subscriptions_shares_submissions_only_within_one_tool() -> None:
+    release = asyncio.Event()
+
+    class BlockingBridge:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        async def __call__(
+            self, tool_name: str, ctx: Context, params: dict[str, Any]
+        ) -> dict[str, Any]:
+            assert tool_name == "manageSubscriptionsBulk"
+            self.calls += 1
+            await release.wait()
+            return {"deleted": [entry["guid"] for entry in params["delete"]]}
+
+    bridges = (BlockingBridge(), BlockingBridge())
+    tools = [
+        register_manage_subscriptions_tool(
+            FastMCP(name=f"TestServer{index}"),
+            bridge,
+            logger=get_logger("test.manage_subscriptions"),
+            default_folder=None,
+            default_type=None,
+        )
+        for index, bridge in enumerate(bridges)
+    ]
+
+    pending = [
+        asyncio.ensure_future(tool(FakeContext(), action="delete", guids=["guid-1"]))
+        for tool in (tools[0], tools[0], tools[1])
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*pending)
+
+    assert [result["status"] for result in results] == ["applied"] * 3
+    assert [bridge.calls for bridge in bridges] == [1, 1]
+
+
 @pytest.mark.asyncio
 async def test_manage_subscriptions_delete_skips_folder_resolution() -> None:
     logger = get_logger("test.manage_subscriptions")
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
 
 import pytest
 
+from birre.config import settings as settings_module
 from birre.config.constants import DEFAULT_CONFIG_FILENAME
 from birre.config.settings import (
     DEFAULT_LOG_FORMAT,
@@ -20,6 +24,8 @@ from birre.config.settings import (
     load_settings,
     logging_from_settings,
     resolve_application_settings,
+    resolve_birre_settings,
+    resolve_config_file_candidates,
     runtime_from_settings,
 )
 
@@ -270,6 +276,93 @@ def test_birre_config_env_overrides_default_config(
     assert runtime.debug is True
 
 
+def test_config_file_candidates_list_existing_files(tmp_path: Path) -> None:
+    config_path = tmp_path / "custom.toml"
+    local_path = tmp_path / "custom.local.toml"
+
+    assert resolve_config_file_candidates(str(config_path)) == (config_path,)
+
+    local_path.write_text("", encoding="utf-8")
+    assert resolve_config_file_candidates(str(config_path)) == (local_path,)
+
+    _write_base_config(config_path)
+    assert resolve_config_file_candidates(str(config_path)) == (
+        config_path,
+        local_path,
+    )
+
+
+def test_local_overlay_is_not_picked_up_from_parent_directory(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    workdir = tmp_path / "project"
+    workdir.mkdir()
+    _write_base_config(workdir / "custom.toml")
+    (tmp_path / "custom.local.toml").write_text(
+        '[bitsight]\napi_key = "stray-key"\n', encoding="utf-8"
+    )
+    monkeypatch.chdir(workdir)
+
+    runtime = runtime_from_settings(load_settings("custom.toml"))
+
+    assert runtime.api_key == "file-key"
+    assert resolve_config_file_candidates("custom.toml") == (Path("custom.toml"),)
+
+
+@pytest.fixture
+def fresh_dotenv_cache() -> Iterator[None]:
+    settings_module.reset_dotenv_cache()
+    yield
+    settings_module.reset_dotenv_cache()
+
+
+@pytest.mark.usefixtures("fresh_dotenv_cache")
+def test_dotenv_is_searched_once_per_root(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config_path = tmp_path / DEFAULT_CONFIG_FILENAME
+    _write_base_config(config_path)
+    (tmp_path / ".env").write_text("BIRRE_SUBSCRIPTION_TYPE=dotenv-type\n")
+    nested = tmp_path / "nested"
+    nested.mkdir()
+    monkeypatch.chdir(tmp_path)
+    # setenv first so teardown removes the value the .env load writes.
+    monkeypatch.setenv("BIRRE_SUBSCRIPTION_TYPE", "placeholder")
+    monkeypatch.delenv("BIRRE_SUBSCRIPTION_TYPE")
+    searches: list[str | None] = []
+    start_dotenv = settings_module.default_settings.start_dotenv
+
+    def counting_start(*, root_path: str | None = None) -> None:
+        searches.append(root_path)
+        start_dotenv(root_path=root_path)
+
+    # Dynaconf reloads ``default_settings`` while it sets up, which would drop a
+    # patch on that module, so swap the reference the settings module holds.
+    monkeypatch.setattr(
+        settings_module,
+        "default_settings",
+        SimpleNamespace(start_dotenv=counting_start),
+    )
+
+    first = runtime_from_settings(load_settings(str(config_path)))
+    second = runtime_from_settings(load_settings(str(config_path)))
+
+    assert first.subscription_type == second.subscription_type == "dotenv-type"
+    assert searches == [None]
+
+    monkeypatch.chdir(nested)
+    load_settings(str(config_path))
+    assert searches == [None, None]
+
+    # A project root does not stop the search walking the working directory.
+    root = str(tmp_path)
+    settings_module._load_dotenv_once(root)
+    settings_module._load_dotenv_once(root)
+    monkeypatch.chdir(tmp_path)
+    settings_module._load_dotenv_once(root)
+    assert searches == [None, None, root, root]
+
+
 def test_logging_env_disable_sentinel(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -333,6 +426,98 @@ def test_resolve_application_settings_combines_sections(tmp_path: Path) -> None:
     assert logging_settings.backup_count == 5
 
 
+def test_resolve_application_settings_loads_config_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config_path = tmp_path / DEFAULT_CONFIG_FILENAME
+    _write_base_config(config_path)
+    calls: list[str | None] = []
+
+    build_dynaconf = settings_module._build_dynaconf
+
+    def counting_build(path: str | None, **kwargs: Any) -> Any:
+        calls.append(path)
+        return build_dynaconf(path, **kwargs)
+
+    monkeypatch.setattr(settings_module, "_build_dynaconf", counting_build)
+
+    runtime, logging_settings = resolve_application_settings(
+        config_path=str(config_path),
+        logging_inputs=LoggingInputs(format="json"),
+    )
+
+    assert calls == [str(config_path)]
+    assert runtime.api_key == "file-key"
+    assert logging_settings.format == "json"
+
+
+def test_full_overrides_skip_settings_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config_path = tmp_path / DEFAULT_CONFIG_FILENAME
+    config_path.write_text("this is not toml = [\n", encoding="utf-8")
+    monkeypatch.setenv("BIRRE_SKIP_STARTUP_CHECKS", "true")
+
+    runtime = resolve_birre_settings(
+        api_key_input="cli-key",
+        config_path=str(config_path),
+        subscription_inputs=SubscriptionInputs(folder="Folder", type="type"),
+        runtime_inputs=RuntimeInputs(
+            context="standard",
+            debug=False,
+            risk_vector_filter="botnet_infections",
+            max_findings=5,
+        ),
+        tls_inputs=TlsInputs(allow_insecure=False, ca_bundle_path="/tmp/ca.pem"),
+    )
+
+    assert runtime.api_key == "cli-key"
+    assert runtime.skip_startup_checks is True
+    assert runtime.max_findings == 5
+
+
+@pytest.mark.usefixtures("fresh_dotenv_cache")
+def test_default_settings_instance_is_built_on_first_access(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    # setitem first so teardown drops the instance the lazy access stores.
+    monkeypatch.setitem(vars(settings_module), "settings", None)
+    monkeypatch.delitem(vars(settings_module), "settings")
+    calls: list[str | None] = []
+    build_dynaconf = settings_module._build_dynaconf
+
+    def counting_build(path: str | None, **kwargs: Any) -> Any:
+        calls.append(path)
+        return build_dynaconf(path, **kwargs)
+
+    monkeypatch.setattr(settings_module, "_build_dynaconf", counting_build)
+
+    assert calls == []
+    first = settings_module.settings
+    assert settings_module.settings is first
+    assert calls == [None]
+    assert "settings" not in settings_module.__all__
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("true", True),
+        ("TRUE", True),
+        (" Yes ", True),
+        ("On", True),
+        ("0", False),
+        ("False", False),
+        ("  off", False),
+        ("", None),
+        ("maybe", None),
+    ],
+)
+def test_coerce_bool_string_spellings(raw: str, expected: bool | None) -> None:
+    assert settings_module._coerce_bool(raw) is expected
+
+
 def test_invalid_values_fall_back_with_warnings(tmp_path: Path) -> None:
     config_path = tmp_path / DEFAULT_CONFIG_FILENAME
     config_path.write_text(